@@ -51,6 +51,7 @@ def _find_break_even_year(
 def compare_best_vs_all(
     results: list[LifecycleResult],
     years: int,
+    sorted_results: Optional[list[LifecycleResult]] = None,
 ) -> Optional[BreakEvenComparison]:
     """
     Compare the best (lowest total emissions) vehicle against every other vehicle.
@@ -58,6 +59,7 @@ def compare_best_vs_all(
     Args:
         results: All lifecycle results from the comparison request
         years:   Ownership period
+        sorted_results: Optional — results already sorted ascending by total
 
     Returns:
         BreakEvenComparison with one BreakEvenPair per comparison vehicle,
@@ -67,7 +69,8 @@ def compare_best_vs_all(
         return None
 
     # Sort ascending by total — index 0 is the best vehicle
-    sorted_results = sorted(results, key=lambda r: r.total)
+    if sorted_results is None:
+        sorted_results = sorted(results, key=lambda r: r.total)
     best = sorted_results[0]
     others = sorted_results[1:]  # everything except the best
 
@@ -86,12 +89,12 @@ def compare_best_vs_all(
             year=break_even_year,
             best_vehicle=best.vehicle_type,
             comparison_vehicle=other.vehicle_type,
-            yearly_best_cumulative=best_curve,
             yearly_comparison_cumulative=comparison_curve,
         ))
 
     return BreakEvenComparison(
         best_vehicle=best.vehicle_type,
         years_range=years_range,
+        yearly_best_cumulative=best_curve,
         pairs=pairs,
     )
\ No newline at end of file
@@ -11,14 +11,29 @@ Disposal:      End-of-life processing + battery recycling
 Inputs change outputs — no hardcoded totals.
 """
 
+from functools import lru_cache
+
 from data_loader import (
-    VEHICLE_PARAMS, FUEL_EMISSION_FACTORS, SIZE_MULTIPLIERS,
+    VEHICLE_PARAMS, FUEL_EMISSION_FACTORS, SIZE_MULTIPLIERS, PRECOMPUTED,
     PHEV_ELECTRIC_FRACTION,
     GREENWASHING_OPERATIONAL_THRESHOLD_PCT, GREENWASHING_TOTAL_THRESHOLD_KG,
 )
 from schemas import LifecycleResult
 
+# Fuel factors hoisted out of the use-phase branches (no per-call dict lookup)
+_PETROL_EF = FUEL_EMISSION_FACTORS["petrol"]
+_DIESEL_EF = FUEL_EMISSION_FACTORS["diesel"]
+
+# Static greenwashing message — no interpolation needed
+_BEV_GRID_DEPENDENCY_REASON = (
+    "On this carbon-intensive grid, BEV use-phase dominates total emissions. "
+    "Consider advocating for grid decarbonisation for maximum benefit."
+)
+
 
+# Pure function of its scalar inputs — repeat configurations are served from cache.
+# Call calculate_lifecycle.cache_clear() if data_loader tables are changed at runtime.
+@lru_cache(maxsize=1024)
 def calculate_lifecycle(
     vehicle_type: str,
     annual_km: float,
@@ -44,14 +59,10 @@ def calculate_lifecycle(
     total_km = annual_km * years
 
     # ── 1. MANUFACTURING PHASE ────────────────────────────────────────────────
-    # Scale glider and powertrain by vehicle size
-    glider_kg = params.glider_manufacturing_kg * size_mult
-    powertrain_kg = params.powertrain_manufacturing_kg * size_mult
-
-    # Battery production scales with capacity * manufacturing intensity
-    # Battery capacity itself scales with vehicle size for BEV/PHEV
-    battery_kwh = params.battery_capacity_kwh * size_mult if params.battery_capacity_kwh > 0 else 0
-    battery_kg = battery_kwh * params.battery_manufacturing_per_kwh
+    # Glider, powertrain and battery are pre-scaled by vehicle size (data_loader.PRECOMPUTED)
+    (
+        glider_kg, powertrain_kg, battery_kg, body_disposal_kg, battery_eol_kg,
+    ) = PRECOMPUTED[(vehicle_type, vehicle_size)]
 
     manufacturing_kg = glider_kg + powertrain_kg + battery_kg
 
@@ -64,11 +75,12 @@ def calculate_lifecycle(
     )
 
     # ── 3. DISPOSAL / END-OF-LIFE PHASE ──────────────────────────────────────
-    disposal_kg = _calculate_disposal(params, battery_kwh, size_mult)
+    # Body disposal cost + battery EOL net cost after recycling credit
+    disposal_kg = body_disposal_kg + battery_eol_kg
 
     # ── 4. TOTALS ─────────────────────────────────────────────────────────────
     total_kg = manufacturing_kg + use_kg + disposal_kg
-    per_km_g = (total_kg / total_km * 1000) if total_km > 0 else 0  # g CO2/km
+    per_km_g = (total_kg / total_km * 1000) if total_km > 0 else 0.0  # g CO2/km
 
     # ── 5. GREENWASHING DETECTION ─────────────────────────────────────────────
     greenwashing_flag, greenwashing_reason = _check_greenwashing(
@@ -104,11 +116,11 @@ def _calculate_use_phase(params, total_km, grid_factor, size_mult) -> float:
 
     elif fuel == "petrol":
         litres_total = (consumption / 100) * total_km
-        return litres_total * FUEL_EMISSION_FACTORS["petrol"]
+        return litres_total * _PETROL_EF
 
     elif fuel == "diesel":
         litres_total = (consumption / 100) * total_km
-        return litres_total * FUEL_EMISSION_FACTORS["diesel"]
+        return litres_total * _DIESEL_EF
 
     elif fuel == "hybrid_petrol":
         # PHEV/HEV: split between electric and fossil fuel portions
@@ -132,27 +144,13 @@ def _calculate_use_phase(params, total_km, grid_factor, size_mult) -> float:
             # HEV: no grid charging; regeneration reduces fuel consumption (already baked into consumption)
             electric_emissions = 0
 
-        fossil_emissions = (consumption / 100) * fossil_km * FUEL_EMISSION_FACTORS["petrol"]
+        fossil_emissions = (consumption / 100) * fossil_km * _PETROL_EF
 
         return electric_emissions + fossil_emissions
 
     raise ValueError(f"Unknown fuel type: {fuel}")
 
 
-def _calculate_disposal(params, battery_kwh_actual, size_mult) -> float:
-    """
-    Calculate end-of-life emissions.
-    Battery disposal/recycling has a net cost (energy for shredding etc.)
-    but also some credit from material recovery.
-    """
-    body_disposal = params.disposal_kg * size_mult
-
-    # Battery EOL: net cost after recycling credit
-    battery_eol = battery_kwh_actual * params.battery_eol_factor
-
-    return body_disposal + battery_eol
-
-
 def _check_greenwashing(use_kg: float, total_kg: float, vehicle_type: str):
     """
     Detect greenwashing: vehicles marketed as 'zero emission'
@@ -163,6 +161,7 @@ def _check_greenwashing(use_kg: float, total_kg: float, vehicle_type: str):
 
     operational_fraction = use_kg / total_kg
 
+    # Only numeric checks run on the unflagged path; reason strings are built on demand.
     # Flag if operational emissions are near-zero but total lifecycle is substantial
     if (
         operational_fraction < GREENWASHING_OPERATIONAL_THRESHOLD_PCT
@@ -178,10 +177,6 @@ def _check_greenwashing(use_kg: float, total_kg: float, vehicle_type: str):
 
     # Secondary flag: BEV on very high-carbon grid may not be cleaner than HEV
     if vehicle_type == "BEV" and operational_fraction > 0.70:
-        reason = (
-            "On this carbon-intensive grid, BEV use-phase dominates total emissions. "
-            "Consider advocating for grid decarbonisation for maximum benefit."
-        )
-        return True, reason
+        return True, _BEV_GRID_DEPENDENCY_REASON
 
     return False, None
@@ -5,10 +5,10 @@ This is the ONLY place where physical constants live — never in the engine.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, NamedTuple, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VehicleParams:
     """Physical and chemical parameters for a vehicle powertrain."""
     # Manufacturing phase (kg CO2-eq)
@@ -36,7 +36,7 @@ FUEL_EMISSION_FACTORS: Dict[str, float] = {
 }
 
 # Vehicle parameter library — medium size class as baseline
-# Small: ~0.85x, Large: ~1.20x multipliers applied in carbon_engine.py
+# Small: ~0.85x, Large: ~1.20x multipliers (see SIZE_MULTIPLIERS / PRECOMPUTED)
 VEHICLE_PARAMS: Dict[str, VehicleParams] = {
     "BEV": VehicleParams(
         glider_manufacturing_kg=6_500,
@@ -97,6 +97,36 @@ SIZE_MULTIPLIERS: Dict[str, float] = {
     "large": 1.20,
 }
 
+
+class ScaledVehicleConstants(NamedTuple):
+    """Size-scaled manufacturing and disposal constants for one (vehicle, size) pair."""
+    glider_kg: float            # kg CO2-eq
+    powertrain_kg: float        # kg CO2-eq
+    battery_kg: float           # kg CO2-eq (battery production)
+    body_disposal_kg: float     # kg CO2-eq
+    battery_eol_kg: float       # kg CO2-eq (battery end-of-life)
+
+
+def _scale(params: VehicleParams, size_mult: float) -> ScaledVehicleConstants:
+    """Apply a size multiplier to the size-dependent parameters of a vehicle."""
+    # Battery capacity scales with vehicle size for BEV/PHEV
+    battery_kwh = params.battery_capacity_kwh * size_mult if params.battery_capacity_kwh > 0 else 0
+    return ScaledVehicleConstants(
+        glider_kg=params.glider_manufacturing_kg * size_mult,
+        powertrain_kg=params.powertrain_manufacturing_kg * size_mult,
+        battery_kg=battery_kwh * params.battery_manufacturing_per_kwh,
+        body_disposal_kg=params.disposal_kg * size_mult,
+        battery_eol_kg=battery_kwh * params.battery_eol_factor,
+    )
+
+
+# Every (vehicle_type, size) combination is enumerable — scale once at import
+PRECOMPUTED: Dict[Tuple[str, str], ScaledVehicleConstants] = {
+    (vehicle_type, size): _scale(params, size_mult)
+    for vehicle_type, params in VEHICLE_PARAMS.items()
+    for size, size_mult in SIZE_MULTIPLIERS.items()
+}
+
 # PHEV electric fraction: estimated share of km driven on electricity
 # Real-world studies show ~40–45% for average driver (ICCT 2020)
 PHEV_ELECTRIC_FRACTION = 0.42
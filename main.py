@@ -9,6 +9,7 @@ Endpoints:
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from schemas import (
     CalculateRequest, LifecycleResult,
@@ -23,18 +24,34 @@ app = FastAPI(
     title="Vehicle Lifecycle Carbon Compare API",
     description="LCA-based CO₂ comparison for EV, Hybrid, and ICE vehicles",
     version="1.0.0",
+    default_response_class=ORJSONResponse,  # C-level JSON encoding for large /compare payloads
 )
 
-# Allow frontend dev server to call the API
+# Allow any origin (incl. the frontend dev server) — the API uses no cookies or auth
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000", "*"],
-    allow_credentials=True,
+    allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+def _calculate_all(vehicles: list[CalculateRequest]) -> list[LifecycleResult]:
+    """Run calculate_lifecycle for each vehicle (served from its LRU cache on repeats)."""
+    return [
+        calculate_lifecycle(
+            vehicle_type=v.vehicle_type,
+            annual_km=v.annual_km,
+            years=v.years,
+            grid_factor=v.grid_factor,
+            vehicle_size=v.vehicle_size,
+        )
+        for v in vehicles
+    ]
+
+
 # ── Routes ─────────────────────────────────────────────────────────────────────
 
 @app.get("/health")
@@ -59,7 +76,7 @@ def calculate_single(req: CalculateRequest):
     """
     try:
         result = calculate_lifecycle(
-            vehicle_type=req.vehicle_type.value,
+            vehicle_type=req.vehicle_type,
             annual_km=req.annual_km,
             years=req.years,
             grid_factor=req.grid_factor,
@@ -94,26 +111,20 @@ def compare_vehicles(req: CompareRequest):
 
     # Calculate lifecycle for each vehicle
     try:
-        results = [
-            calculate_lifecycle(
-                vehicle_type=v.vehicle_type.value,
-                annual_km=v.annual_km,
-                years=v.years,
-                grid_factor=v.grid_factor,
-                vehicle_size=v.vehicle_size,
-            )
-            for v in req.vehicles
-        ]
+        results = _calculate_all(req.vehicles)
     except KeyError as e:
         raise HTTPException(status_code=400, detail=f"Unknown vehicle type: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Break-even between best and worst emitters
-    break_even = compare_best_vs_all(results, years)
+    # Sort once — shared by break-even and recommendation
+    sorted_results = sorted(results, key=lambda r: r.total)
+
+    # Break-even between best and every other vehicle
+    break_even = compare_best_vs_all(results, years, sorted_results=sorted_results)
 
     # Recommendation engine
-    recommendation = recommend_vehicle(results)
+    recommendation = recommend_vehicle(results, sorted_results=sorted_results)
 
     return CompareResponse(
         results=results,
@@ -5,10 +5,15 @@ Selects the vehicle with the lowest total lifecycle CO2-eq emissions,
 computes confidence, and generates human-readable reasoning.
 """
 
+from typing import Optional
+
 from schemas import LifecycleResult, RecommendationResult
 
 
-def recommend_vehicle(results: list[LifecycleResult]) -> RecommendationResult:
+def recommend_vehicle(
+    results: list[LifecycleResult],
+    sorted_results: Optional[list[LifecycleResult]] = None,
+) -> RecommendationResult:
     """
     Recommend the vehicle with the lowest total lifecycle emissions.
 
@@ -17,6 +22,7 @@ def recommend_vehicle(results: list[LifecycleResult]) -> RecommendationResult:
 
     Args:
         results: List of LifecycleResult objects (≥2 vehicles)
+        sorted_results: Optional — results already sorted ascending by total
 
     Returns:
         RecommendationResult with recommended vehicle and reasoning
@@ -25,7 +31,8 @@ def recommend_vehicle(results: list[LifecycleResult]) -> RecommendationResult:
         raise ValueError("No results to evaluate")
 
     # Sort by total emissions ascending
-    sorted_results = sorted(results, key=lambda r: r.total)
+    if sorted_results is None:
+        sorted_results = sorted(results, key=lambda r: r.total)
     best = sorted_results[0]
     worst = sorted_results[-1]
 
@@ -41,10 +48,10 @@ def recommend_vehicle(results: list[LifecycleResult]) -> RecommendationResult:
 
     # Savings vs worst
     savings_kg = worst.total - best.total
-    savings_pct = (savings_kg / worst.total * 100) if worst.total > 0 else 0
+    savings_pct = (savings_kg / worst.total * 100) if worst.total > 0 else 0.0
 
     # Generate reasoning
-    reasoning = _build_reasoning(best, worst, sorted_results, savings_kg, savings_pct)
+    reasoning = _build_reasoning(best, worst, savings_kg, savings_pct)
 
     return RecommendationResult(
         recommended_vehicle=best.vehicle_type,
@@ -59,7 +66,6 @@ def recommend_vehicle(results: list[LifecycleResult]) -> RecommendationResult:
 def _build_reasoning(
     best: LifecycleResult,
     worst: LifecycleResult,
-    sorted_results: list[LifecycleResult],
     savings_kg: float,
     savings_pct: float,
 ) -> str:
@@ -3,7 +3,7 @@ schemas.py — Pydantic models for request/response validation.
 All user-facing inputs are validated here before reaching the engine.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Literal, Optional
 from enum import Enum
 
@@ -17,6 +17,9 @@ class VehicleType(str, Enum):
 
 
 class CalculateRequest(BaseModel):
+    # Store the validated enum's plain string value — the engine keys on it directly
+    model_config = ConfigDict(use_enum_values=True)
+
     vehicle_type: VehicleType
     annual_km: float = Field(..., gt=0, le=100_000, description="Annual distance driven in km")
     years: int = Field(..., ge=1, le=30, description="Ownership period in years")
@@ -33,6 +36,9 @@ class CalculateRequest(BaseModel):
 
 
 class LifecycleResult(BaseModel):
+    # Frozen: instances are shared by the calculate_lifecycle cache
+    model_config = ConfigDict(frozen=True)
+
     vehicle_type: str
     manufacturing: float   # kg CO2-eq
     use_phase: float       # kg CO2-eq
@@ -56,7 +62,6 @@ class BreakEvenPair(BaseModel):
     year: Optional[int]
     best_vehicle: str                    # the recommended (lowest-emission) vehicle
     comparison_vehicle: str             # the vehicle it's being compared against
-    yearly_best_cumulative: list[float]
     yearly_comparison_cumulative: list[float]
 
 
@@ -67,6 +72,7 @@ class BreakEvenComparison(BaseModel):
     """
     best_vehicle: str
     years_range: list[int]              # shared x-axis for all pairs
+    yearly_best_cumulative: list[float] # best vehicle's curve, shared by all pairs
     pairs: list[BreakEvenPair]          # one entry per comparison vehicle
 
 
@@ -194,13 +194,13 @@ export default function App() {
   }));
 
   // Build line chart data: one row per year, columns = best vehicle + each comparison vehicle
-  // The best vehicle's curve is the same across all pairs — we only need it once
+  // The best vehicle's curve is shared by all pairs — sent once on break_even
   const lineData = results?.break_even
     ? results.break_even.years_range.map((y, i) => {
       const row = { year: `Yr ${y}` };
-      // Best vehicle curve (same in every pair — take from first pair)
+      // Best vehicle curve
       row[results.break_even.best_vehicle] =
-        results.break_even.pairs[0].yearly_best_cumulative[i];
+        results.break_even.yearly_best_cumulative[i];
       // Each comparison vehicle's curve
       results.break_even.pairs.forEach((pair) => {
         row[pair.comparison_vehicle] = pair.yearly_comparison_cumulative[i];